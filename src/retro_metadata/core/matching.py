@@ -89,19 +89,17 @@ def find_best_match(
     candidates_to_check = candidates[:first_n_only] if first_n_only else candidates
 
     for candidate in candidates_to_check:
+        # If split mode is enabled and candidate contains delimiters, use the last part
+        if split_candidate_name:
+            candidate_name = SEARCH_TERM_SPLIT_PATTERN.split(candidate)[-1]
+        else:
+            candidate_name = candidate
+
         # Normalize the candidate name
         if normalize:
-            candidate_normalized = normalize_search_term(candidate)
+            candidate_normalized = normalize_search_term(candidate_name)
         else:
-            candidate_normalized = candidate.lower().strip()
-
-        # If split mode is enabled and candidate contains delimiters, try the last part
-        if split_candidate_name and re.search(SEARCH_TERM_SPLIT_PATTERN, candidate):
-            parts = SEARCH_TERM_SPLIT_PATTERN.split(candidate)
-            if normalize:
-                candidate_normalized = normalize_search_term(parts[-1])
-            else:
-                candidate_normalized = parts[-1].lower().strip()
+            candidate_normalized = candidate_name.lower().strip()
 
         # Calculate similarity
         score = _jarowinkler.similarity(search_term_normalized, candidate_normalized)
@@ -8,9 +8,7 @@ import logging
 import re
 from typing import TYPE_CHECKING, Any, Final
 
-import aiohttp
-import yarl
-from aiohttp.client import ClientTimeout
+import httpx
 
 from retro_metadata.core.exceptions import (
     ProviderAuthenticationError,
@@ -106,6 +104,17 @@ GAMES_FIELDS: Final = (
 
 SEARCH_FIELDS: Final = ("game.id", "name")
 
+# Game types accepted by the filtered identify search, rendered once as an
+# APICalypse clause instead of rebuilding it from the enum on every lookup
+IDENTIFY_GAME_TYPES: Final = (
+    GameType.MAIN_GAME,
+    GameType.EXPANDED_GAME,
+    GameType.PORT,
+    GameType.REMAKE,
+    GameType.REMASTER,
+)
+IDENTIFY_GAME_TYPE_FILTER: Final = f"& category=({','.join(map(str, IDENTIFY_GAME_TYPES))})"
+
 
 class IGDBProvider(MetadataProvider):
     """IGDB metadata provider.
@@ -133,10 +142,10 @@ class IGDBProvider(MetadataProvider):
         user_agent: str = "retro-metadata/1.0",
     ) -> None:
         super().__init__(config, cache)
-        self._base_url = yarl.URL("https://api.igdb.com/v4")
+        self._base_url = "https://api.igdb.com/v4"
         self._twitch_url = "https://id.twitch.tv/oauth2/token"
         self._user_agent = user_agent
-        self._session: aiohttp.ClientSession | None = None
+        self._client: httpx.AsyncClient | None = None
         self._oauth_token: str | None = None
         self._pagination_limit = 200
 
@@ -148,11 +157,16 @@ class IGDBProvider(MetadataProvider):
     def client_secret(self) -> str:
         return self.config.get_credential("client_secret")
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create the aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the httpx client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": self._user_agent,
+                },
+                timeout=self.config.timeout,
+            )
+        return self._client
 
     async def _get_oauth_token(self) -> str:
         """Get or refresh the OAuth token from Twitch."""
@@ -161,7 +175,7 @@ class IGDBProvider(MetadataProvider):
         if cached_token:
             return cached_token
 
-        session = await self._get_session()
+        client = await self._get_client()
         params = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
@@ -169,25 +183,23 @@ class IGDBProvider(MetadataProvider):
         }
 
         try:
-            async with session.post(self._twitch_url, params=params) as response:
-                if response.status == 400:
-                    raise ProviderAuthenticationError(
-                        self.name, "Invalid client_id or client_secret"
-                    )
-                response.raise_for_status()
-                data = await response.json()
-
-                token = data.get("access_token", "")
-                expires_in = data.get("expires_in", 0)
-
-                if token and expires_in > 0:
-                    # Cache the token
-                    await self._set_cached("oauth_token", token, expires_in - 60)
-                    self._oauth_token = token
-                    return token
-
-                raise ProviderAuthenticationError(self.name, "Failed to obtain OAuth token")
-        except aiohttp.ClientError as e:
+            response = await client.post(self._twitch_url, params=params)
+            if response.status_code == 400:
+                raise ProviderAuthenticationError(self.name, "Invalid client_id or client_secret")
+            response.raise_for_status()
+            data = response.json()
+
+            token = data.get("access_token", "")
+            expires_in = data.get("expires_in", 0)
+
+            if token and expires_in > 0:
+                # Cache the token
+                await self._set_cached("oauth_token", token, expires_in - 60)
+                self._oauth_token = token
+                return token
+
+            raise ProviderAuthenticationError(self.name, "Failed to obtain OAuth token")
+        except httpx.HTTPError as e:
             raise ProviderConnectionError(self.name, str(e)) from e
 
     async def _request(
@@ -200,8 +212,8 @@ class IGDBProvider(MetadataProvider):
     ) -> list[dict[str, Any]]:
         """Make an API request to IGDB."""
         token = await self._get_oauth_token()
-        session = await self._get_session()
-        url = str(self._base_url.joinpath(endpoint))
+        client = await self._get_client()
+        url = f"{self._base_url}/{endpoint}"
 
         # Build query
         query_parts = []
@@ -229,37 +241,33 @@ class IGDBProvider(MetadataProvider):
             "Accept": "application/json",
             "Authorization": f"Bearer {token}",
             "Client-ID": self.client_id,
-            "User-Agent": self._user_agent,
         }
 
         try:
-            async with session.post(
-                url,
-                data=body,
-                headers=headers,
-                timeout=ClientTimeout(total=self.config.timeout),
-            ) as response:
-                if response.status == 401:
-                    # Token expired, clear cache and retry once
-                    logger.debug("IGDB API: 401 Unauthorized, token expired")
-                    self._oauth_token = None
-                    if self.cache:
-                        await self.cache.delete(f"{self.name}:oauth_token")
-                    raise ProviderAuthenticationError(self.name, "Token expired")
-                elif response.status == 429:
-                    logger.debug("IGDB API: 429 Rate limited")
-                    raise ProviderRateLimitError(self.name, retry_after=2)
-                response.raise_for_status()
-                data = await response.json()
-
-                # Log full response body only when debug logging is enabled
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(
-                        "IGDB API response:\n%s", json.dumps(data, indent=2, ensure_ascii=False)
-                    )
+            response = await client.post(url, content=body, headers=headers)
+
+            if response.status_code == 401:
+                # Token expired, clear cache and retry once
+                logger.debug("IGDB API: 401 Unauthorized, token expired")
+                self._oauth_token = None
+                if self.cache:
+                    await self.cache.delete(f"{self.name}:oauth_token")
+                raise ProviderAuthenticationError(self.name, "Token expired")
+            elif response.status_code == 429:
+                logger.debug("IGDB API: 429 Rate limited")
+                raise ProviderRateLimitError(self.name, retry_after=2)
+
+            response.raise_for_status()
+            data = response.json()
+
+            # Log full response body only when debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "IGDB API response:\n%s", json.dumps(data, indent=2, ensure_ascii=False)
+                )
 
-                return data
-        except aiohttp.ClientError as e:
+            return data
+        except httpx.HTTPError as e:
             logger.debug("IGDB API error: %s", e)
             raise ProviderConnectionError(self.name, str(e)) from e
 
@@ -379,15 +387,7 @@ class IGDBProvider(MetadataProvider):
             return None
 
         # Search with game type filter first
-        categories = (
-            GameType.MAIN_GAME,
-            GameType.EXPANDED_GAME,
-            GameType.PORT,
-            GameType.REMAKE,
-            GameType.REMASTER,
-        )
-        game_type_filter = f"& category=({','.join(map(str, categories))})"
-        where = f"platforms=[{platform_id}] {game_type_filter}"
+        where = f"platforms=[{platform_id}] {IDENTIFY_GAME_TYPE_FILTER}"
 
         results = await self._request(
             "games",
@@ -626,9 +626,9 @@ class IGDBProvider(MetadataProvider):
         )
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session is not None and not self._session.closed:
-            await self._session.close()
+        """Close the httpx client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
 
 # IGDB age rating mappings
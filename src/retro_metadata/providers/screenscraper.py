@@ -446,24 +446,25 @@ class ScreenScraperProvider(MetadataProvider):
         if not games:
             return None
 
-        # Build name mapping
-        games_by_name: dict[str, dict[str, Any]] = {}
+        # Build name mapping, preferring the lowest game ID for duplicate names.
+        # ScreenScraper sends IDs as strings, so parse each one once up front.
+        games_by_name: dict[str, tuple[int, dict[str, Any]]] = {}
         for game in games:
             if not game.get("id"):
                 continue
+            game_id = int(game["id"])
             for name in game.get("noms", []):
                 name_text = name.get("text", "")
                 if name_text and (
-                    name_text not in games_by_name
-                    or int(game["id"]) < int(games_by_name[name_text]["id"])
+                    name_text not in games_by_name or game_id < games_by_name[name_text][0]
                 ):
-                    games_by_name[name_text] = game
+                    games_by_name[name_text] = (game_id, game)
 
         # Find best match
         best_match, score = self.find_best_match(search_term, list(games_by_name.keys()))
 
         if best_match and best_match in games_by_name:
-            game_result = self._build_game_result(games_by_name[best_match])
+            game_result = self._build_game_result(games_by_name[best_match][1])
             game_result.match_score = score
             return game_result
 
@@ -506,12 +507,13 @@ class ScreenScraperProvider(MetadataProvider):
         # Extract metadata
         metadata = self._extract_metadata(game)
 
+        game_id = int(game["id"])
         return GameResult(
             name=name.replace(" : ", ": "),
             summary=summary,
             provider=self.name,
-            provider_id=int(game["id"]),
-            provider_ids={"screenscraper": int(game["id"])},
+            provider_id=game_id,
+            provider_ids={"screenscraper": game_id},
             artwork=Artwork(
                 cover_url=cover_url,
                 screenshot_urls=screenshot_urls,
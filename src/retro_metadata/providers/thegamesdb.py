@@ -271,17 +271,17 @@ class TheGamesDBProvider(MetadataProvider):
 
         result = await self._request("/Games/ByGameName", params)
 
-        if "data" not in result or "games" not in result["data"]:
+        # An empty search comes back as {"data": {"games": []}}, so check the
+        # list itself rather than just the presence of the keys
+        games = result.get("data", {}).get("games") or []
+        if not games:
             # Try with split search term
             terms = self.split_search_term(search_term)
             if len(terms) > 1:
                 params["name"] = terms[-1]
                 result = await self._request("/Games/ByGameName", params)
+                games = result.get("data", {}).get("games") or []
 
-        if "data" not in result or "games" not in result["data"]:
-            return None
-
-        games = result["data"]["games"]
         if not games:
             return None
 
@@ -6,7 +6,7 @@ Based on the IGDB API documentation: https://api-docs.igdb.com/
 from __future__ import annotations
 
 import enum
-from typing import Literal, NewType, TypedDict, TypeGuard
+from typing import Any, Literal, TypedDict, TypeGuard
 
 # Type for expandable fields - can be an ID or the full object
 type ExpandableField[T] = T | int
@@ -23,23 +23,23 @@ def mark_list_expanded[T](value: list[ExpandableField[T]]) -> TypeGuard[list[T]]
 
 
 # Placeholder for unimplemented entity types
-UnimplementedEntity = NewType("UnimplementedEntity", dict)
-AgeRatingContentDescription = UnimplementedEntity
-Artwork = UnimplementedEntity
-CollectionRelation = UnimplementedEntity
-ExternalGame = UnimplementedEntity
-GameEngine = UnimplementedEntity
-GameMode = UnimplementedEntity
-InvolvedCompany = UnimplementedEntity
-Keyword = UnimplementedEntity
-LanguageSupport = UnimplementedEntity
-PlatformVersionReleaseDate = UnimplementedEntity
-PlatformWebsite = UnimplementedEntity
-PlayerPerspective = UnimplementedEntity
-ReleaseDate = UnimplementedEntity
-TagNumber = UnimplementedEntity
-Theme = UnimplementedEntity
-Website = UnimplementedEntity
+type UnimplementedEntity = dict[str, Any]
+type AgeRatingContentDescription = UnimplementedEntity
+type Artwork = UnimplementedEntity
+type CollectionRelation = UnimplementedEntity
+type ExternalGame = UnimplementedEntity
+type GameEngine = UnimplementedEntity
+type GameMode = UnimplementedEntity
+type InvolvedCompany = UnimplementedEntity
+type Keyword = UnimplementedEntity
+type LanguageSupport = UnimplementedEntity
+type PlatformVersionReleaseDate = UnimplementedEntity
+type PlatformWebsite = UnimplementedEntity
+type PlayerPerspective = UnimplementedEntity
+type ReleaseDate = UnimplementedEntity
+type TagNumber = UnimplementedEntity
+type Theme = UnimplementedEntity
+type Website = UnimplementedEntity
 
 
 class IGDBEntity(TypedDict):
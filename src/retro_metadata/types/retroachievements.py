@@ -43,8 +43,8 @@ class RAUserCompletionProgressKind(enum.StrEnum):
     BEATEN_SOFTCORE = "beaten-softcore"
 
 
-class RAGameExtendedDetailsAchievement(TypedDict):
-    """RetroAchievements achievement in extended game details."""
+class RAAchievementBase(TypedDict):
+    """Fields shared by every RetroAchievements achievement shape."""
 
     ID: int
     NumAwarded: int
@@ -63,8 +63,12 @@ class RAGameExtendedDetailsAchievement(TypedDict):
     type: RAGameAchievementType | None
 
 
-class RAGameExtendedDetails(TypedDict):
-    """RetroAchievements extended game details."""
+class RAGameExtendedDetailsAchievement(RAAchievementBase):
+    """RetroAchievements achievement in extended game details."""
+
+
+class RAGameBase(TypedDict):
+    """Fields shared by the RetroAchievements game detail shapes."""
 
     ID: int
     Title: str
@@ -81,16 +85,21 @@ class RAGameExtendedDetails(TypedDict):
     ReleasedAtGranularity: RAGameReleasedAtGranularity
     RichPresencePatch: str
     GuideURL: str | None
-    Updated: str
     ConsoleName: str
     ParentGameID: int | None
     NumDistinctPlayers: int
     NumAchievements: int
-    Achievements: dict[str, RAGameExtendedDetailsAchievement]
     NumDistinctPlayersCasual: int
     NumDistinctPlayersHardcore: int
 
 
+class RAGameExtendedDetails(RAGameBase):
+    """RetroAchievements extended game details."""
+
+    Updated: str
+    Achievements: dict[str, RAGameExtendedDetailsAchievement]
+
+
 class RAUserCompletionProgressResult(TypedDict):
     """RetroAchievements user completion progress result."""
 
@@ -110,55 +119,19 @@ class RAUserCompletionProgressResult(TypedDict):
 RAUserCompletionProgress = PaginatedResponse[RAUserCompletionProgressResult]
 
 
-class RAGameInfoAndUserProgressAchievement(TypedDict):
+class RAGameInfoAndUserProgressAchievement(RAAchievementBase):
     """RetroAchievements achievement with user progress."""
 
-    ID: int
-    NumAwarded: int
-    NumAwardedHardcore: int
-    Title: str
-    Description: str
-    Points: int
-    TrueRatio: int
-    Author: str
-    AuthorULID: str
-    DateModified: str
-    DateCreated: str
-    BadgeName: str
-    DisplayOrder: int
-    MemAddr: str
-    type: RAGameAchievementType | None
     DateEarnedHardcore: NotRequired[str]
     DateEarned: NotRequired[str]
 
 
-class RAGameInfoAndUserProgress(TypedDict):
+class RAGameInfoAndUserProgress(RAGameBase):
     """RetroAchievements game info with user progress."""
 
-    ID: int
-    Title: str
-    ConsoleID: int
-    ForumTopicID: int | None
-    ImageIcon: str
-    ImageTitle: str
-    ImageIngame: str
-    ImageBoxArt: str
-    Publisher: str
-    Developer: str
-    Genre: str
-    Released: str
-    ReleasedAtGranularity: RAGameReleasedAtGranularity
-    RichPresencePatch: str
-    GuideURL: str | None
-    ConsoleName: str
-    ParentGameID: int | None
-    NumDistinctPlayers: int
-    NumAchievements: int
     Achievements: dict[str, RAGameInfoAndUserProgressAchievement]
     NumAwardedToUser: int
     NumAwardedToUserHardcore: int
-    NumDistinctPlayersCasual: int
-    NumDistinctPlayersHardcore: int
     UserCompletion: str
     UserCompletionHardcore: str
     HighestAwardKind: NotRequired[RAUserCompletionProgressKind]
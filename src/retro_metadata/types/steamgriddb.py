@@ -77,8 +77,8 @@ class SGDBGridAuthor(TypedDict):
     avatar: str
 
 
-class SGDBGrid(TypedDict):
-    """SteamGridDB grid image."""
+class SGDBImage(TypedDict):
+    """Fields shared by every SteamGridDB image type."""
 
     id: int
     score: int
@@ -89,6 +89,18 @@ class SGDBGrid(TypedDict):
     author: SGDBGridAuthor
 
 
+class SGDBSizedImage(SGDBImage):
+    """SteamGridDB image that also reports its dimensions."""
+
+    width: int
+    height: int
+    notes: str | None
+
+
+class SGDBGrid(SGDBImage):
+    """SteamGridDB grid image."""
+
+
 class SGDBGame(TypedDict):
     """SteamGridDB game."""
 
@@ -98,50 +110,17 @@ class SGDBGame(TypedDict):
     verified: bool
 
 
-class SGDBHero(TypedDict):
+class SGDBHero(SGDBSizedImage):
     """SteamGridDB hero image."""
 
-    id: int
-    score: int
-    style: SGDBStyle
-    url: str
-    thumb: str
-    tags: list[str]
-    author: SGDBGridAuthor
-    width: int
-    height: int
-    notes: str | None
-
 
-class SGDBLogo(TypedDict):
+class SGDBLogo(SGDBSizedImage):
     """SteamGridDB logo image."""
 
-    id: int
-    score: int
-    style: SGDBStyle
-    url: str
-    thumb: str
-    tags: list[str]
-    author: SGDBGridAuthor
-    width: int
-    height: int
-    notes: str | None
 
-
-class SGDBIcon(TypedDict):
+class SGDBIcon(SGDBSizedImage):
     """SteamGridDB icon image."""
 
-    id: int
-    score: int
-    style: SGDBStyle
-    url: str
-    thumb: str
-    tags: list[str]
-    author: SGDBGridAuthor
-    width: int
-    height: int
-    notes: str | None
-
 
 SGDBGridList = PaginatedResponse[SGDBGrid]
 SGDBHeroList = PaginatedResponse[SGDBHero]
@@ -1,16 +1,37 @@
-"""Utility functions for retro-metadata."""
-
-from retro_metadata.utils.filename import (
-    clean_filename,
-    extract_region,
-    extract_tags,
-    get_file_extension,
-)
-from retro_metadata.utils.hashing import (
-    compute_crc32,
-    compute_md5,
-    compute_sha1,
-)
+"""Utility functions for retro-metadata.
+
+The helpers are imported on first attribute access so that importing
+``retro_metadata.utils`` for one function does not load every submodule.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from retro_metadata.utils.filename import (
+        clean_filename,
+        extract_region,
+        extract_tags,
+        get_file_extension,
+    )
+    from retro_metadata.utils.hashing import (
+        compute_crc32,
+        compute_md5,
+        compute_sha1,
+    )
+
+# Maps each public name to the submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "clean_filename": "retro_metadata.utils.filename",
+    "extract_region": "retro_metadata.utils.filename",
+    "extract_tags": "retro_metadata.utils.filename",
+    "get_file_extension": "retro_metadata.utils.filename",
+    "compute_crc32": "retro_metadata.utils.hashing",
+    "compute_md5": "retro_metadata.utils.hashing",
+    "compute_sha1": "retro_metadata.utils.hashing",
+}
 
 __all__ = [
     "clean_filename",
@@ -21,3 +42,17 @@ __all__ = [
     "compute_md5",
     "compute_sha1",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
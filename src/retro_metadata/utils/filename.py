@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -58,13 +61,36 @@ REGION_TAGS: Final[dict[str, str]] = {
     "ru": "ru",
 }
 
+# Tags marking demo or pre-release dumps
+DEMO_TAGS: Final[frozenset[str]] = frozenset(
+    {"demo", "sample", "trial", "preview", "proto", "prototype", "beta", "alpha"}
+)
+
+# Tags marking unlicensed or modified dumps
+UNLICENSED_TAGS: Final[frozenset[str]] = frozenset({"unl", "unlicensed", "pirate", "hack"})
+
 # Pattern to match tags in parentheses or brackets
 TAG_PATTERN: Final = re.compile(r"[\(\[]([^\)\]]+)[\)\]]")
 
 # Pattern to match file extensions
 EXTENSION_PATTERN: Final = re.compile(r"\.([a-zA-Z0-9]+)$")
 
+# Pattern to match a whole comma-separated region name inside a tag
+# (longest names first so "usa" wins over "us" and "u")
+REGION_PATTERN: Final = re.compile(
+    r"(?:^|,)\s*("
+    + "|".join(re.escape(tag) for tag in sorted(REGION_TAGS, key=len, reverse=True))
+    + r")\s*(?=,|$)",
+    re.IGNORECASE,
+)
+
 
+def _has_tags(text: str) -> bool:
+    """Cheap pre-check: TAG_PATTERN can only match after an opening bracket."""
+    return "(" in text or "[" in text
+
+
+@lru_cache(maxsize=4096)
 def get_file_extension(filename: str) -> str:
     """Get the file extension from a filename.
 
@@ -74,8 +100,13 @@ def get_file_extension(filename: str) -> str:
     Returns:
         File extension without the dot, or empty string if none
     """
-    match = EXTENSION_PATTERN.search(filename)
-    return match.group(1).lower() if match else ""
+    # Same rule as EXTENSION_PATTERN (ASCII alphanumerics after the last dot),
+    # checked with string methods instead of running the regex engine
+    _, dot, extension = filename.rpartition(".")
+    if dot and extension.isascii() and extension.isalnum():
+        # Extensions have few distinct values and are used as lookup keys
+        return sys.intern(extension.lower())
+    return ""
 
 
 def extract_tags(filename: str) -> list[str]:
@@ -93,9 +124,19 @@ def extract_tags(filename: str) -> list[str]:
         >>> extract_tags("Super Mario World (USA) [!].sfc")
         ['USA', '!']
     """
-    return TAG_PATTERN.findall(filename)
+    # Copy so callers can mutate the result without touching the cache
+    return list(_extract_tags(filename))
+
 
+@lru_cache(maxsize=4096)
+def _extract_tags(filename: str) -> tuple[str, ...]:
+    """Cached, immutable form of extract_tags."""
+    if not _has_tags(filename):
+        return ()
+    return tuple(TAG_PATTERN.findall(filename))
 
+
+@lru_cache(maxsize=4096)
 def extract_region(filename: str) -> str | None:
     """Extract the region code from a filename.
 
@@ -111,20 +152,24 @@ def extract_region(filename: str) -> str | None:
         >>> extract_region("Zelda (Europe).sfc")
         'eu'
     """
-    tags = extract_tags(filename)
+    if not _has_tags(filename):
+        return None
+    return _region_from_tags(match.group(1) for match in TAG_PATTERN.finditer(filename))
 
-    for tag in tags:
-        tag_lower = tag.lower().strip()
 
-        # Handle comma-separated regions (e.g., "USA, Europe")
-        for part in tag_lower.split(","):
-            part = part.strip()
-            if part in REGION_TAGS:
-                return REGION_TAGS[part]
+def _region_from_tags(tags: Iterable[str]) -> str | None:
+    """Return the first normalized region code found in the given tags."""
+    for tag in tags:
+        # Handles comma-separated regions (e.g., "USA, Europe") in one scan
+        for region_match in REGION_PATTERN.finditer(tag):
+            region = REGION_TAGS.get(region_match.group(1).lower())
+            if region:
+                return region
 
     return None
 
 
+@lru_cache(maxsize=4096)
 def clean_filename(filename: str, remove_extension: bool = True) -> str:
     """Clean a filename by removing tags and optionally the extension.
 
@@ -153,7 +198,8 @@ def clean_filename(filename: str, remove_extension: bool = True) -> str:
         name = EXTENSION_PATTERN.sub("", name)
 
     # Remove all tags in parentheses and brackets
-    name = TAG_PATTERN.sub("", name)
+    if _has_tags(name):
+        name = TAG_PATTERN.sub("", name)
 
     # Clean up extra whitespace
     name = " ".join(name.split())
@@ -181,10 +227,51 @@ def parse_no_intro_filename(filename: str) -> dict[str, str | list[str] | None]:
         >>> parse_no_intro_filename("Super Mario World (USA) (Rev 1).sfc")
         {'name': 'Super Mario World', 'region': 'us', 'tags': ['Rev 1'], ...}
     """
-    name = clean_filename(filename)
-    tags = extract_tags(filename)
-    region = extract_region(filename)
-    extension = get_file_extension(filename)
+    name, region, version, languages, extension, tags = _parse_no_intro_filename(filename)
+    # Build fresh lists so callers can mutate the result without touching the cache
+    return {
+        "name": name,
+        "region": region,
+        "version": version,
+        "languages": list(languages) if languages else None,
+        "extension": extension,
+        "tags": list(tags),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _parse_no_intro_filename(
+    filename: str,
+) -> tuple[str, str | None, str | None, tuple[str, ...], str, tuple[str, ...]]:
+    """Cached, immutable form of parse_no_intro_filename.
+
+    Returns:
+        Tuple of (name, region, version, languages, extension, tags)
+    """
+    # Strip the extension and collect tags while removing them, so a bare
+    # filename is scanned once per pattern instead of once per helper
+    basename = Path(filename).name
+    ext_match = EXTENSION_PATTERN.search(basename)
+    name = basename[: ext_match.start()] if ext_match else basename
+
+    tags: list[str] = []
+
+    def collect_tag(match: re.Match[str]) -> str:
+        tags.append(match.group(1))
+        return ""
+
+    if _has_tags(name):
+        name = TAG_PATTERN.sub(collect_tag, name)
+    name = " ".join(name.split())
+
+    if basename == filename:
+        extension = sys.intern(ext_match.group(1).lower()) if ext_match else ""
+    else:
+        # Directory components can carry tags and change the extension match
+        tags = extract_tags(filename)
+        extension = get_file_extension(filename)
+
+    region = _region_from_tags(tags)
 
     # Try to identify version
     version = None
@@ -201,14 +288,36 @@ def parse_no_intro_filename(filename: str) -> dict[str, str | list[str] | None]:
         if tag_lower in language_codes or "+" in tag_lower:
             languages.append(tag)
 
-    return {
-        "name": name,
-        "region": region,
-        "version": version,
-        "languages": languages if languages else None,
-        "extension": extension,
-        "tags": tags,
-    }
+    return name, region, version, tuple(languages), extension, tuple(tags)
+
+
+@lru_cache(maxsize=4096)
+def classify_filename(filename: str) -> frozenset[str]:
+    """Classify a filename as BIOS, demo and/or unlicensed in one pass.
+
+    Args:
+        filename: The filename to check
+
+    Returns:
+        Set containing any of "bios", "demo" and "unlicensed"
+
+    Example:
+        >>> classify_filename("Game (Proto) (Unl).nes")
+        frozenset({'demo', 'unlicensed'})
+    """
+    kinds: set[str] = set()
+    # "[bios]" and "(bios)" both contain "bios", so one substring scan covers them
+    if "bios" in filename.lower():
+        kinds.add("bios")
+    if not _has_tags(filename):
+        return frozenset(kinds)
+    for match in TAG_PATTERN.finditer(filename):
+        tag = match.group(1).lower()
+        if tag in DEMO_TAGS:
+            kinds.add("demo")
+        elif tag in UNLICENSED_TAGS:
+            kinds.add("unlicensed")
+    return frozenset(kinds)
 
 
 def is_bios_file(filename: str) -> bool:
@@ -220,9 +329,7 @@ def is_bios_file(filename: str) -> bool:
     Returns:
         True if the file appears to be a BIOS file
     """
-    name_lower = filename.lower()
-    bios_indicators = ["bios", "[bios]", "(bios)"]
-    return any(indicator in name_lower for indicator in bios_indicators)
+    return "bios" in classify_filename(filename)
 
 
 def is_demo_file(filename: str) -> bool:
@@ -234,9 +341,7 @@ def is_demo_file(filename: str) -> bool:
     Returns:
         True if the file appears to be a demo
     """
-    tags = [t.lower() for t in extract_tags(filename)]
-    demo_tags = {"demo", "sample", "trial", "preview", "proto", "prototype", "beta", "alpha"}
-    return bool(demo_tags & set(tags))
+    return "demo" in classify_filename(filename)
 
 
 def is_unlicensed(filename: str) -> bool:
@@ -248,6 +353,4 @@ def is_unlicensed(filename: str) -> bool:
     Returns:
         True if the file appears to be unlicensed
     """
-    tags = [t.lower() for t in extract_tags(filename)]
-    unlicensed_tags = {"unl", "unlicensed", "pirate", "hack"}
-    return bool(unlicensed_tags & set(tags))
+    return "unlicensed" in classify_filename(filename)
@@ -2,12 +2,108 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
-import zlib
+import io
+import os
+import stat
+import threading
+from collections.abc import Buffer, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Final
 
+# Prefer ISA-L's SIMD CRC32 when the optional "hashing" extra is installed; it
+# computes the same IEEE CRC32 as zlib, so results are interchangeable.
+try:
+    from isal.isal_zlib import crc32  # type: ignore[import-not-found,unused-ignore]
+except ImportError:
+    from zlib import crc32
 
-def compute_crc32(file_path: str | Path, chunk_size: int = 65536) -> str:
+
+# Default read size; a multiple of the page size that matches typical
+# readahead windows, so large files need far fewer read calls
+DEFAULT_CHUNK_SIZE: Final = 1024 * 1024
+
+# Files at least this large are hashed on several threads at once
+PARALLEL_HASH_THRESHOLD: Final = 8 * 1024 * 1024
+
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Return the shared pool used to fan out MD5/SHA1 work."""
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            # Two tasks per file; size for concurrent callers on every core
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=2 * (os.cpu_count() or 1), thread_name_prefix="retro-metadata-hash"
+            )
+        return _hash_executor
+
+
+def _reset_hash_executor() -> None:
+    """Drop the pool inherited across fork(), whose threads exist only in the parent."""
+    global _hash_executor, _hash_executor_lock
+    _hash_executor = None
+    _hash_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_hash_executor)
+
+
+def _noatime_opener(file_path: str, flags: int) -> int:
+    """Open a file descriptor with O_NOATIME where the OS allows it."""
+    noatime = getattr(os, "O_NOATIME", 0)
+    try:
+        return os.open(file_path, flags | noatime)
+    except PermissionError:
+        # O_NOATIME is only permitted for the file's owner
+        if not noatime:
+            raise
+        return os.open(file_path, flags)
+
+
+def _open_for_hashing(file_path: str | Path) -> io.BufferedReader:
+    """Open a file for a single sequential read.
+
+    Uses O_NOATIME where available so scanning a library does not write an
+    access-time update for every ROM, and hints sequential access to the
+    kernel so it reads ahead more aggressively.
+    """
+    # open() owns the descriptor from the opener and closes it on failure
+    f = open(file_path, "rb", opener=_noatime_opener)  # noqa: SIM115
+    if hasattr(os, "posix_fadvise"):
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+
+def _read_chunks(f: io.BufferedReader, chunk_size: int) -> Iterator[Buffer]:
+    """Yield successive chunks of a file, reusing one read buffer.
+
+    Each chunk may be a view into the shared buffer and is only valid until
+    the next chunk is requested.
+    """
+    st = os.fstat(f.fileno())
+    if stat.S_ISREG(st.st_mode) and 0 < st.st_size <= chunk_size:
+        # Most ROMs fit in one chunk; a single read() is cheaper than
+        # allocating and zero-filling a full-size buffer for them
+        if data := f.read():
+            yield data
+        return
+    buffer = bytearray(chunk_size)
+    with memoryview(buffer) as view:
+        while size := f.readinto(view):
+            with view[:size] as chunk:
+                yield chunk
+
+
+def compute_crc32(file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
     """Compute CRC32 checksum of a file.
 
     Args:
@@ -22,18 +118,24 @@ def compute_crc32(file_path: str | Path, chunk_size: int = 65536) -> str:
         'A1B2C3D4'
     """
     crc = 0
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            crc = zlib.crc32(chunk, crc)
+    with _open_for_hashing(file_path) as f:
+        for chunk in _read_chunks(f, chunk_size):
+            crc = crc32(chunk, crc)
     return format(crc & 0xFFFFFFFF, "08X")
 
 
-def compute_md5(file_path: str | Path, chunk_size: int = 65536) -> str:
+def compute_md5(
+    file_path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,  # noqa: ARG001
+) -> str:
     """Compute MD5 hash of a file.
 
+    The read loop runs inside ``hashlib.file_digest``, so ``chunk_size`` is
+    accepted for API compatibility but not used.
+
     Args:
         file_path: Path to the file
-        chunk_size: Size of chunks to read at a time
+        chunk_size: Unused, kept for compatibility with the other helpers
 
     Returns:
         MD5 hash as lowercase hex string
@@ -42,19 +144,22 @@ def compute_md5(file_path: str | Path, chunk_size: int = 65536) -> str:
         >>> compute_md5("game.sfc")
         'a1b2c3d4e5f6...'
     """
-    hasher = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    with _open_for_hashing(file_path) as f:
+        return hashlib.file_digest(f, "md5").hexdigest()
 
 
-def compute_sha1(file_path: str | Path, chunk_size: int = 65536) -> str:
+def compute_sha1(
+    file_path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,  # noqa: ARG001
+) -> str:
     """Compute SHA1 hash of a file.
 
+    The read loop runs inside ``hashlib.file_digest``, so ``chunk_size`` is
+    accepted for API compatibility but not used.
+
     Args:
         file_path: Path to the file
-        chunk_size: Size of chunks to read at a time
+        chunk_size: Unused, kept for compatibility with the other helpers
 
     Returns:
         SHA1 hash as lowercase hex string
@@ -63,14 +168,13 @@ def compute_sha1(file_path: str | Path, chunk_size: int = 65536) -> str:
         >>> compute_sha1("game.sfc")
         'a1b2c3d4e5f6...'
     """
-    hasher = hashlib.sha1()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    with _open_for_hashing(file_path) as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
 
 
-def compute_all_hashes(file_path: str | Path, chunk_size: int = 65536) -> dict[str, str]:
+def compute_all_hashes(
+    file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict[str, str]:
     """Compute all common hashes of a file in a single pass.
 
     More efficient than calling individual functions when you need
@@ -87,15 +191,43 @@ def compute_all_hashes(file_path: str | Path, chunk_size: int = 65536) -> dict[s
         >>> compute_all_hashes("game.sfc")
         {'crc32': 'A1B2C3D4', 'md5': 'a1b2...', 'sha1': 'a1b2...'}
     """
+    return _compute_all_hashes(file_path, chunk_size, fan_out=True)
+
+
+def _compute_all_hashes(file_path: str | Path, chunk_size: int, fan_out: bool) -> dict[str, str]:
+    """Implementation of compute_all_hashes.
+
+    With fan_out, MD5 and SHA1 of large files run on the shared hash pool.
+    Batch callers already hash one file per thread and pass False.
+    """
     crc = 0
     md5_hasher = hashlib.md5()
     sha1_hasher = hashlib.sha1()
 
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            crc = zlib.crc32(chunk, crc)
-            md5_hasher.update(chunk)
-            sha1_hasher.update(chunk)
+    with _open_for_hashing(file_path) as f:
+        st = os.fstat(f.fileno())
+        chunks = _read_chunks(f, chunk_size)
+        if fan_out and stat.S_ISREG(st.st_mode) and st.st_size >= PARALLEL_HASH_THRESHOLD:
+            # The hashers release the GIL on large buffers, so run MD5 and
+            # SHA1 on worker threads while this thread does CRC32
+            executor = _get_hash_executor()
+            for chunk in chunks:
+                futures = [
+                    executor.submit(md5_hasher.update, chunk),
+                    executor.submit(sha1_hasher.update, chunk),
+                ]
+                try:
+                    crc = crc32(chunk, crc)
+                finally:
+                    # The chunk is a view into the read buffer, so the workers
+                    # must be done with it before the next read overwrites it
+                    for future in futures:
+                        future.result()
+        else:
+            for chunk in chunks:
+                crc = crc32(chunk, crc)
+                md5_hasher.update(chunk)
+                sha1_hasher.update(chunk)
 
     return {
         "crc32": format(crc & 0xFFFFFFFF, "08X"),
@@ -104,6 +236,37 @@ def compute_all_hashes(file_path: str | Path, chunk_size: int = 65536) -> dict[s
     }
 
 
+def compute_all_hashes_many(
+    file_paths: Iterable[str | Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> list[dict[str, str]]:
+    """Compute all common hashes for a batch of files.
+
+    Files are hashed concurrently on a thread pool so that reads for one
+    file overlap with hashing of another, which keeps the disk busy when
+    scanning a whole ROM library.
+
+    Args:
+        file_paths: Paths to the files
+        chunk_size: Size of chunks to read at a time
+        max_workers: Maximum number of files to hash at once
+            (defaults to the ThreadPoolExecutor default)
+
+    Returns:
+        List of hash dictionaries in the same order as file_paths
+
+    Example:
+        >>> compute_all_hashes_many(["a.sfc", "b.sfc"])
+        [{'crc32': 'A1B2C3D4', ...}, {'crc32': 'E5F6A7B8', ...}]
+    """
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="retro-metadata-hash-batch"
+    ) as executor:
+        hash_file = partial(_compute_all_hashes, chunk_size=chunk_size, fan_out=False)
+        return list(executor.map(hash_file, file_paths))
+
+
 def compute_crc32_from_buffer(data: bytes) -> str:
     """Compute CRC32 checksum of a bytes buffer.
 
@@ -113,7 +276,7 @@ def compute_crc32_from_buffer(data: bytes) -> str:
     Returns:
         CRC32 checksum as uppercase hex string
     """
-    crc = zlib.crc32(data) & 0xFFFFFFFF
+    crc = crc32(data) & 0xFFFFFFFF
     return format(crc, "08X")
 
 
@@ -141,7 +304,7 @@ def compute_sha1_from_buffer(data: bytes) -> str:
     return hashlib.sha1(data).hexdigest()
 
 
-async def compute_crc32_async(file_path: str | Path, chunk_size: int = 65536) -> str:
+async def compute_crc32_async(file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
     """Async version of compute_crc32.
 
     Uses asyncio to avoid blocking on file I/O.
@@ -158,7 +321,7 @@ async def compute_crc32_async(file_path: str | Path, chunk_size: int = 65536) ->
     return await asyncio.to_thread(compute_crc32, file_path, chunk_size)
 
 
-async def compute_md5_async(file_path: str | Path, chunk_size: int = 65536) -> str:
+async def compute_md5_async(file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
     """Async version of compute_md5.
 
     Uses asyncio to avoid blocking on file I/O.
@@ -175,7 +338,7 @@ async def compute_md5_async(file_path: str | Path, chunk_size: int = 65536) -> s
     return await asyncio.to_thread(compute_md5, file_path, chunk_size)
 
 
-async def compute_sha1_async(file_path: str | Path, chunk_size: int = 65536) -> str:
+async def compute_sha1_async(file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
     """Async version of compute_sha1.
 
     Uses asyncio to avoid blocking on file I/O.
@@ -193,7 +356,7 @@ async def compute_sha1_async(file_path: str | Path, chunk_size: int = 65536) ->
 
 
 async def compute_all_hashes_async(
-    file_path: str | Path, chunk_size: int = 65536
+    file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
 ) -> dict[str, str]:
     """Async version of compute_all_hashes.
 
@@ -209,3 +372,27 @@ async def compute_all_hashes_async(
     import asyncio
 
     return await asyncio.to_thread(compute_all_hashes, file_path, chunk_size)
+
+
+async def compute_all_hashes_many_async(
+    file_paths: Iterable[str | Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> list[dict[str, str]]:
+    """Async version of compute_all_hashes_many.
+
+    Uses asyncio to avoid blocking on file I/O.
+
+    Args:
+        file_paths: Paths to the files
+        chunk_size: Size of chunks to read at a time
+        max_workers: Maximum number of files to hash at once
+
+    Returns:
+        List of hash dictionaries in the same order as file_paths
+    """
+    import asyncio
+
+    return await asyncio.to_thread(
+        compute_all_hashes_many, list(file_paths), chunk_size, max_workers
+    )
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from _pytest.mark import ParameterSet
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Root directory for test data
-TESTDATA_DIR = Path(__file__).parent.parent.parent / "testdata"
+TESTDATA_DIR = (Path(__file__).parent.parent.parent / "testdata").resolve()
 
 
 class SharedTestDataLoader:
@@ -45,11 +54,12 @@ class SharedTestDataLoader:
     def _load_data(self) -> dict[str, Any]:
         """Load test data from the JSON file."""
         file_path = TESTDATA_DIR / self.category / f"{self.test_suite}.json"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Test data file not found: {file_path}")
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Test data file not found: {file_path}") from None
 
-        with open(file_path) as f:
-            return json.load(f)
+        return json_loads(raw)
 
     @property
     def version(self) -> str:
@@ -108,7 +118,7 @@ class SharedTestDataLoader:
         self,
         category: str | None = None,
         skip_python: bool = True,
-    ) -> list[tuple[str, dict[str, Any]]]:
+    ) -> list[ParameterSet]:
         """Get test cases formatted for pytest.mark.parametrize.
 
         Args:
@@ -116,10 +126,11 @@ class SharedTestDataLoader:
             skip_python: If True, exclude tests marked to skip in Python
 
         Returns:
-            List of (test_id, test_case) tuples for parametrize
+            List of (test_id, test_case) params, each using the test ID as
+            its pytest ID so the test case dict is never repr'd
         """
         cases = self.get_test_cases(category=category, skip_python=skip_python)
-        return [(c["id"], c) for c in cases]
+        return [pytest.param(c["id"], c, id=c["id"]) for c in cases]
 
 
 @lru_cache(maxsize=32)
@@ -140,7 +151,7 @@ def pytest_generate_tests_from_data(
     category: str,
     test_suite: str,
     filter_category: str | None = None,
-) -> list[tuple[str, dict[str, Any]]]:
+) -> list[ParameterSet]:
     """Generate pytest parameters from test data.
 
     This is a convenience function for use with pytest.mark.parametrize.
@@ -160,7 +171,7 @@ def pytest_generate_tests_from_data(
         filter_category: Optional category filter
 
     Returns:
-        List of (test_id, test_case) tuples
+        List of (test_id, test_case) params with readable IDs
     """
     loader = load_test_data(category, test_suite)
     return loader.get_pytest_params(category=filter_category)
@@ -3,6 +3,7 @@
 import pytest
 
 from retro_metadata.utils.filename import (
+    classify_filename,
     clean_filename,
     extract_region,
     extract_tags,
@@ -12,7 +13,7 @@ from retro_metadata.utils.filename import (
     is_unlicensed,
     parse_no_intro_filename,
 )
-from tests.helpers.test_data_loader import pytest_generate_tests_from_data
+from tests.helpers.test_data_loader import load_test_data, pytest_generate_tests_from_data
 
 
 class TestGetFileExtension:
@@ -96,14 +97,12 @@ class TestParseNoIntroFilename:
         result = parse_no_intro_filename(test_case["input"])
         expected = test_case["expected"]
 
-        # Check name
-        assert result["name"] == expected["name"], f"Test {test_id}: name mismatch"
-
-        # Check region
-        assert result["region"] == expected["region"], f"Test {test_id}: region mismatch"
-
-        # Check extension
-        assert result["extension"] == expected["extension"], f"Test {test_id}: extension mismatch"
+        # Check name, region and extension together
+        assert (result["name"], result["region"], result["extension"]) == (
+            expected["name"],
+            expected["region"],
+            expected["extension"],
+        ), f"Test {test_id}: name/region/extension mismatch"
 
         # Check version (can be null)
         if expected["version"] is not None:
@@ -156,3 +155,39 @@ class TestIsUnlicensed:
         result = is_unlicensed(test_case["input"])
         expected = test_case["expected"]
         assert result == expected, f"Test {test_id}: expected {expected}, got {result}"
+
+
+class TestClassifyFilename:
+    """Tests for classify_filename function."""
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("Super Mario World (USA).sfc", set()),
+            ("[BIOS] PlayStation (USA).bin", {"bios"}),
+            ("Game (Demo).sfc", {"demo"}),
+            ("Game (Unl).nes", {"unlicensed"}),
+            ("Game (Proto) (Unl).nes", {"demo", "unlicensed"}),
+            ("[BIOS] Game (Beta) (Pirate).bin", {"bios", "demo", "unlicensed"}),
+        ],
+    )
+    def test_classify_filename(self, filename, expected):
+        """Test classifying filenames into kinds."""
+        assert classify_filename(filename) == expected
+
+    @pytest.mark.parametrize(
+        "filename",
+        sorted(
+            {
+                case["input"]
+                for suite in ("is_bios_file", "is_demo_file", "is_unlicensed")
+                for case in load_test_data("filename", suite).get_test_cases()
+            }
+        ),
+    )
+    def test_agrees_with_predicates(self, filename):
+        """Test classify_filename matches is_bios_file, is_demo_file and is_unlicensed."""
+        kinds = classify_filename(filename)
+        assert ("bios" in kinds) == is_bios_file(filename)
+        assert ("demo" in kinds) == is_demo_file(filename)
+        assert ("unlicensed" in kinds) == is_unlicensed(filename)
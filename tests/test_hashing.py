@@ -0,0 +1,210 @@
+"""Tests for the file hashing utilities."""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+import zlib
+from pathlib import Path
+
+import pytest
+
+from retro_metadata.utils import hashing
+from retro_metadata.utils.hashing import (
+    PARALLEL_HASH_THRESHOLD,
+    compute_all_hashes,
+    compute_all_hashes_many,
+    compute_all_hashes_many_async,
+    compute_crc32,
+    compute_md5,
+    compute_sha1,
+)
+
+
+def reference_hashes(data: bytes) -> dict[str, str]:
+    """Compute the expected hashes directly with zlib and hashlib."""
+    return {
+        "crc32": format(zlib.crc32(data) & 0xFFFFFFFF, "08X"),
+        "md5": hashlib.md5(data).hexdigest(),
+        "sha1": hashlib.sha1(data).hexdigest(),
+    }
+
+
+class TestComputeSingleHash:
+    """Tests for compute_crc32, compute_md5 and compute_sha1."""
+
+    @pytest.fixture(params=[0, 1, 64 * 1024, 64 * 1024 + 1, 3 * 1024 * 1024 + 7])
+    def rom_file(self, request, tmp_path):
+        """Write a file of each size, around and past the chunk sizes under test."""
+        data = os.urandom(request.param)
+        path = tmp_path / "game.bin"
+        path.write_bytes(data)
+        return path, data
+
+    @pytest.mark.parametrize("chunk_size", [4096, 64 * 1024, hashing.DEFAULT_CHUNK_SIZE])
+    def test_crc32(self, rom_file, chunk_size):
+        """Test CRC32 across files smaller and larger than the read buffer."""
+        path, data = rom_file
+        assert compute_crc32(path, chunk_size=chunk_size) == reference_hashes(data)["crc32"]
+
+    def test_md5(self, rom_file):
+        """Test MD5 matches hashlib."""
+        path, data = rom_file
+        assert compute_md5(path) == reference_hashes(data)["md5"]
+
+    def test_sha1(self, rom_file):
+        """Test SHA1 matches hashlib."""
+        path, data = rom_file
+        assert compute_sha1(path) == reference_hashes(data)["sha1"]
+
+
+class TestNoatimeOpener:
+    """Tests for opening files without updating their access time."""
+
+    @pytest.fixture
+    def deny_noatime(self, monkeypatch):
+        """Make O_NOATIME fail as it does for a file owned by another user."""
+        os_open = os.open
+
+        def fake_open(path, flags, *args, **kwargs):
+            if flags & os.O_NOATIME:
+                raise PermissionError(1, "Operation not permitted", path)
+            return os_open(path, flags, *args, **kwargs)
+
+        monkeypatch.setattr(os, "open", fake_open)
+
+    @pytest.mark.skipif(not hasattr(os, "O_NOATIME"), reason="requires O_NOATIME")
+    @pytest.mark.usefixtures("deny_noatime")
+    def test_falls_back_without_noatime(self, tmp_path):
+        """Test a file we may not open with O_NOATIME is opened normally."""
+        data = os.urandom(4096)
+        path = tmp_path / "game.bin"
+        path.write_bytes(data)
+
+        assert compute_all_hashes(path) == reference_hashes(data)
+        assert compute_crc32(path) == reference_hashes(data)["crc32"]
+
+    @pytest.mark.skipif(not hasattr(os, "O_NOATIME"), reason="requires O_NOATIME")
+    @pytest.mark.usefixtures("deny_noatime")
+    def test_missing_file_still_raises(self, tmp_path):
+        """Test the fallback does not hide other open errors."""
+        with pytest.raises(FileNotFoundError):
+            compute_crc32(tmp_path / "missing.bin")
+
+
+class TestComputeAllHashes:
+    """Tests for compute_all_hashes function."""
+
+    @pytest.mark.parametrize("size", [0, 1, 16 * 1024, 3 * 1024 * 1024 + 7])
+    def test_regular_file(self, tmp_path, size):
+        """Test hashing regular files of various sizes."""
+        data = os.urandom(size)
+        path = tmp_path / "game.bin"
+        path.write_bytes(data)
+
+        assert compute_all_hashes(path) == reference_hashes(data)
+
+    def test_large_file_matches_chunked(self, tmp_path, monkeypatch):
+        """Test the threaded path for large files against the chunked path."""
+        data = os.urandom(PARALLEL_HASH_THRESHOLD + 12345)
+        path = tmp_path / "game.iso"
+        path.write_bytes(data)
+
+        threaded = compute_all_hashes(path)
+        # Raising the threshold sends the same file down the chunked path
+        monkeypatch.setattr(hashing, "PARALLEL_HASH_THRESHOLD", len(data) + 1)
+        chunked = compute_all_hashes(path)
+
+        assert threaded == reference_hashes(data)
+        assert threaded == chunked
+
+    def test_file_truncated_while_hashing(self, tmp_path, monkeypatch):
+        """Test a file that shrinks mid-read ends the hash instead of crashing."""
+        chunk_size = 64 * 1024
+        data = os.urandom(16 * chunk_size)
+        path = tmp_path / "game.bin"
+        path.write_bytes(data)
+
+        def truncating_crc32(chunk, crc=0):
+            # Simulate the ROM being rewritten after the first chunk is read
+            os.truncate(path, 4096)
+            return zlib.crc32(chunk, crc)
+
+        monkeypatch.setattr(hashing, "crc32", truncating_crc32)
+
+        result = compute_all_hashes(path, chunk_size=chunk_size)
+
+        assert result == reference_hashes(data[:chunk_size])
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork()"
+    )
+    @pytest.mark.filterwarnings("ignore:.*multi-threaded.*fork:DeprecationWarning")
+    def test_large_file_in_forked_child(self, tmp_path):
+        """Test the hash pool works in a child forked after the parent used it."""
+        data = os.urandom(PARALLEL_HASH_THRESHOLD + 1)
+        path = tmp_path / "game.iso"
+        path.write_bytes(data)
+        expected = reference_hashes(data)
+
+        # Start the shared pool in the parent before forking
+        assert compute_all_hashes(path) == expected
+
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            result = pool.apply_async(compute_all_hashes, (path,)).get(timeout=30)
+
+        assert result == expected
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_fifo(self, tmp_path):
+        """Test hashing a pipe, which reports a size of 0 but has content."""
+        data = b"retro-metadata" * 4096
+        path = tmp_path / "game.fifo"
+        os.mkfifo(path)
+
+        writer = threading.Thread(target=path.write_bytes, args=(data,))
+        writer.start()
+        try:
+            result = compute_all_hashes(path)
+        finally:
+            writer.join()
+
+        assert result == reference_hashes(data)
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/cmdline"), reason="requires procfs")
+    def test_procfs_file(self):
+        """Test hashing a procfs file, which reports a size of 0 but has content."""
+        data = Path("/proc/self/cmdline").read_bytes()
+        assert data
+
+        assert compute_all_hashes("/proc/self/cmdline") == reference_hashes(data)
+
+
+class TestComputeAllHashesMany:
+    """Tests for compute_all_hashes_many and its async version."""
+
+    @pytest.fixture
+    def rom_files(self, tmp_path):
+        """Write files of varied sizes, largest first, so they finish out of order."""
+        files = []
+        for index, size in enumerate([PARALLEL_HASH_THRESHOLD + 1, 64 * 1024, 0, 1, 4096]):
+            data = os.urandom(size)
+            path = tmp_path / f"game{index}.bin"
+            path.write_bytes(data)
+            files.append((path, data))
+        return files
+
+    def test_preserves_input_order(self, rom_files):
+        """Test results line up with the input paths."""
+        results = compute_all_hashes_many([path for path, _ in rom_files], max_workers=4)
+        assert results == [reference_hashes(data) for _, data in rom_files]
+
+    def test_accepts_iterator(self, rom_files):
+        """Test file paths can be a one-shot iterator."""
+        results = compute_all_hashes_many(path for path, _ in rom_files)
+        assert results == [reference_hashes(data) for _, data in rom_files]
+
+    async def test_async_preserves_input_order(self, rom_files):
+        """Test the async version returns results in input order."""
+        results = await compute_all_hashes_many_async(path for path, _ in rom_files)
+        assert results == [reference_hashes(data) for _, data in rom_files]
@@ -1,231 +1,331 @@
 """Integration tests for metadata providers using shared fixture data."""
 
-import json
 import re
-from pathlib import Path
+from functools import cache
 
 import httpx
 import pytest
 import respx
-from aioresponses import aioresponses
 
+from retro_metadata.cache import MemoryCache
 from retro_metadata.core.config import ProviderConfig
+from retro_metadata.core.exceptions import ProviderAuthenticationError, ProviderConnectionError
 from retro_metadata.providers.igdb import IGDBProvider
 from retro_metadata.providers.mobygames import MobyGamesProvider
+from retro_metadata.providers.thegamesdb import TheGamesDBProvider
+from tests.helpers.test_data_loader import TESTDATA_DIR
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-def load_fixture(provider: str, filename: str) -> dict | list:
-    """Load a fixture file from testdata/fixtures."""
-    # Find the testdata directory by walking up
-    current_dir = Path(__file__).parent
-    while current_dir.name != "" and not (current_dir / "testdata").exists():
-        current_dir = current_dir.parent
 
-    fixture_path = current_dir / "testdata" / "fixtures" / provider / filename
-    if not fixture_path.exists():
-        pytest.skip(f"Fixture file not found: {fixture_path}")
+# Root directory for provider fixtures
+FIXTURES_DIR = TESTDATA_DIR / "fixtures"
+
+# (provider, filename) pairs of every fixture on disk, scanned once at import
+FIXTURE_FILES = frozenset((path.parent.name, path.name) for path in FIXTURES_DIR.glob("*/*.json"))
+
+# URL patterns for mocked endpoints (matching any query parameters)
+OAUTH_URL_PATTERN = re.compile(r"https://id\.twitch\.tv/oauth2/token.*")
+IGDB_GAMES_URL_PATTERN = re.compile(r"https://api\.igdb\.com/v4/games.*")
+MOBYGAMES_GAMES_URL_PATTERN = re.compile(r"https://api\.mobygames\.com/v1/games.*")
+THEGAMESDB_BY_NAME_URL_PATTERN = re.compile(r"https://api\.thegamesdb\.net/v1/Games/ByGameName.*")
+
 
-    with open(fixture_path) as f:
-        return json.load(f)
+@cache
+def _read_fixture(provider: str, filename: str) -> bytes:
+    """Read a fixture file once per session."""
+    return (FIXTURES_DIR / provider / filename).read_bytes()
+
+
+def load_fixture(provider: str, filename: str) -> dict | list:
+    """Load a fixture file from testdata/fixtures.
+
+    The file contents are cached, but each call parses them into a fresh
+    object so tests can mutate the result freely.
+    """
+    if (provider, filename) not in FIXTURE_FILES:
+        pytest.skip(f"Fixture file not found: {FIXTURES_DIR / provider / filename}")
+
+    return json_loads(_read_fixture(provider, filename))
+
+
+# Session-scoped fixtures are shared by every test, so treat them as read-only
+@pytest.fixture(scope="session")
+def igdb_config():
+    """Create a test IGDB configuration."""
+    return ProviderConfig(
+        enabled=True,
+        credentials={
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+        },
+        timeout=30,
+    )
+
+
+@pytest.fixture(scope="session")
+def oauth_response():
+    """Return the OAuth token response."""
+    return {
+        "access_token": "test_token",
+        "expires_in": 3600,
+        "token_type": "bearer",
+    }
+
+
+@pytest.fixture(scope="session")
+def mobygames_config():
+    """Create a test MobyGames configuration."""
+    return ProviderConfig(
+        enabled=True,
+        credentials={
+            "api_key": "test_api_key",
+        },
+        timeout=30,
+    )
+
+
+@pytest.fixture(scope="session")
+def thegamesdb_config():
+    """Create a test TheGamesDB configuration."""
+    return ProviderConfig(
+        enabled=True,
+        credentials={
+            "api_key": "test_api_key",
+        },
+        timeout=30,
+    )
+
+
+@pytest.fixture
+async def igdb_provider(igdb_config, oauth_response):
+    """Create an IGDB provider with a cached OAuth token and close it after the test."""
+    cache = MemoryCache()
+    provider = IGDBProvider(igdb_config, cache=cache)
+    # Seed the token cache so requests skip the Twitch OAuth round trip
+    await cache.set(
+        f"{provider.name}:oauth_token",
+        oauth_response["access_token"],
+        oauth_response["expires_in"],
+    )
+    yield provider
+    await provider.close()
+    await cache.close()
+
+
+@pytest.fixture
+async def igdb_provider_without_token(igdb_config):
+    """Create an IGDB provider with an empty cache, so it must fetch an OAuth token."""
+    cache = MemoryCache()
+    provider = IGDBProvider(igdb_config, cache=cache)
+    yield provider
+    await provider.close()
+    await cache.close()
+
+
+@pytest.fixture
+async def mobygames_provider(mobygames_config):
+    """Create a MobyGames provider and close it after the test."""
+    provider = MobyGamesProvider(mobygames_config)
+    yield provider
+    await provider.close()
+
+
+@pytest.fixture
+async def thegamesdb_provider(thegamesdb_config):
+    """Create a TheGamesDB provider and close it after the test."""
+    provider = TheGamesDBProvider(thegamesdb_config)
+    yield provider
+    await provider.close()
+
+
+@pytest.fixture
+def http_mock():
+    """Mock httpx requests made by the providers."""
+    with respx.mock as mocked:
+        yield mocked
 
 
 class TestIGDBProviderIntegration:
     """Integration tests for IGDB provider using mocked HTTP responses."""
 
-    @pytest.fixture
-    def igdb_config(self):
-        """Create a test IGDB configuration."""
-        return ProviderConfig(
-            enabled=True,
-            credentials={
-                "client_id": "test_client_id",
-                "client_secret": "test_client_secret",
-            },
-            timeout=30,
-        )
-
-    @pytest.fixture
-    def oauth_response(self):
-        """Return the OAuth token response."""
-        return {
-            "access_token": "test_token",
-            "expires_in": 3600,
-            "token_type": "bearer",
-        }
-
-    async def test_igdb_search(self, igdb_config, oauth_response):
+    async def test_igdb_search(self, igdb_provider, http_mock):
         """Test IGDB search returns expected results."""
         search_response = load_fixture("igdb", "search_mario.json")
 
-        with aioresponses() as mocked:
-            # Mock OAuth token endpoint (use pattern to match URL with query params)
-            mocked.post(
-                re.compile(r"https://id\.twitch\.tv/oauth2/token.*"),
-                payload=oauth_response,
-            )
-
-            # Mock IGDB search endpoint
-            mocked.post(
-                re.compile(r"https://api\.igdb\.com/v4/games.*"),
-                payload=search_response,
-            )
-
-            provider = IGDBProvider(igdb_config)
+        # Mock IGDB search endpoint
+        http_mock.post(IGDB_GAMES_URL_PATTERN).mock(
+            return_value=httpx.Response(200, json=search_response)
+        )
 
-            try:
-                results = await provider.search("Super Mario", limit=10)
+        results = await igdb_provider.search("Super Mario", limit=10)
 
-                assert len(results) > 0, "Expected results, got none"
-                assert results[0].name == "Super Mario World"
-                assert results[0].provider == "igdb"
-                assert results[0].provider_id == 1074
-            finally:
-                await provider.close()
+        assert len(results) > 0, "Expected results, got none"
+        assert results[0].name == "Super Mario World"
+        assert results[0].provider == "igdb"
+        assert results[0].provider_id == 1074
 
-    async def test_igdb_get_by_id(self, igdb_config, oauth_response):
+    async def test_igdb_get_by_id(self, igdb_provider, http_mock):
         """Test IGDB get_by_id returns expected game details."""
         game_response = load_fixture("igdb", "game_1074.json")
 
-        with aioresponses() as mocked:
-            # Mock OAuth token endpoint (use pattern to match URL with query params)
-            mocked.post(
-                re.compile(r"https://id\.twitch\.tv/oauth2/token.*"),
-                payload=oauth_response,
-            )
+        # Mock IGDB games endpoint
+        http_mock.post(IGDB_GAMES_URL_PATTERN).mock(
+            return_value=httpx.Response(200, json=game_response)
+        )
 
-            # Mock IGDB games endpoint
-            mocked.post(
-                re.compile(r"https://api\.igdb\.com/v4/games.*"),
-                payload=game_response,
-            )
+        result = await igdb_provider.get_by_id(1074)
 
-            provider = IGDBProvider(igdb_config)
+        assert result is not None, "Expected result, got None"
+        assert result.name == "Super Mario World"
+        assert result.summary is not None and len(result.summary) > 0
 
-            try:
-                result = await provider.get_by_id(1074)
+        # Verify metadata
+        assert len(result.metadata.genres) > 0, "Expected genres"
+        assert len(result.metadata.companies) > 0, "Expected companies"
 
-                assert result is not None, "Expected result, got None"
-                assert result.name == "Super Mario World"
-                assert result.summary is not None and len(result.summary) > 0
+        # Verify artwork
+        assert result.artwork.cover_url != "", "Expected cover URL"
+        assert len(result.artwork.screenshot_urls) > 0, "Expected screenshots"
 
-                # Verify metadata
-                assert len(result.metadata.genres) > 0, "Expected genres"
-                assert len(result.metadata.companies) > 0, "Expected companies"
+    async def test_igdb_fetches_and_caches_oauth_token(
+        self, igdb_provider_without_token, oauth_response, http_mock
+    ):
+        """Test IGDB fetches a Twitch token once and reuses it from the cache."""
+        search_response = load_fixture("igdb", "search_mario.json")
 
-                # Verify artwork
-                assert result.artwork.cover_url != "", "Expected cover URL"
-                assert len(result.artwork.screenshot_urls) > 0, "Expected screenshots"
-            finally:
-                await provider.close()
+        # Mock OAuth token and IGDB search endpoints
+        oauth_route = http_mock.post(OAUTH_URL_PATTERN).mock(
+            return_value=httpx.Response(200, json=oauth_response)
+        )
+        games_route = http_mock.post(IGDB_GAMES_URL_PATTERN).mock(
+            return_value=httpx.Response(200, json=search_response)
+        )
+
+        for _ in range(2):
+            results = await igdb_provider_without_token.search("Super Mario", limit=10)
+            assert results[0].provider_id == 1074
+
+        assert oauth_route.call_count == 1
+        token_request = oauth_route.calls.last.request
+        assert token_request.url.params["client_id"] == "test_client_id"
+        assert token_request.url.params["grant_type"] == "client_credentials"
+
+        assert games_route.call_count == 2
+        games_request = games_route.calls.last.request
+        assert games_request.headers["Authorization"] == f"Bearer {oauth_response['access_token']}"
+        assert games_request.headers["Client-ID"] == "test_client_id"
+
+    async def test_igdb_invalid_credentials(self, igdb_provider_without_token, http_mock):
+        """Test IGDB raises an authentication error when Twitch rejects the credentials."""
+        # Mock OAuth token endpoint with 400 error
+        http_mock.post(OAUTH_URL_PATTERN).mock(return_value=httpx.Response(400))
+
+        with pytest.raises(ProviderAuthenticationError):
+            await igdb_provider_without_token.search("Test", limit=10)
 
 
 class TestMobyGamesProviderIntegration:
     """Integration tests for MobyGames provider using mocked HTTP responses."""
 
-    @pytest.fixture
-    def mobygames_config(self):
-        """Create a test MobyGames configuration."""
-        return ProviderConfig(
-            enabled=True,
-            credentials={
-                "api_key": "test_api_key",
-            },
-            timeout=30,
-        )
-
-    @respx.mock
-    async def test_mobygames_search(self, mobygames_config):
+    async def test_mobygames_search(self, mobygames_provider, http_mock):
         """Test MobyGames search returns expected results."""
         search_response = load_fixture("mobygames", "search_zelda.json")
 
-        # Mock MobyGames search endpoint using respx for httpx
-        respx.get(re.compile(r"https://api\.mobygames\.com/v1/games.*")).mock(
+        # Mock MobyGames search endpoint
+        http_mock.get(MOBYGAMES_GAMES_URL_PATTERN).mock(
             return_value=httpx.Response(200, json=search_response)
         )
 
-        provider = MobyGamesProvider(mobygames_config)
-
-        try:
-            results = await provider.search("Legend of Zelda", limit=10)
+        results = await mobygames_provider.search("Legend of Zelda", limit=10)
+
+        assert len(results) > 0, "Expected results, got none"
+        assert results[0].name == "The Legend of Zelda: A Link to the Past"
+        assert results[0].provider == "mobygames"
+        assert results[0].provider_id == 564
+
+
+class TestTheGamesDBProviderIntegration:
+    """Integration tests for TheGamesDB provider using mocked HTTP responses."""
+
+    game_response = {
+        "data": {
+            "count": 1,
+            "games": [
+                {"id": 1234, "game_title": "Castlevania: Symphony of the Night", "platform": 10}
+            ],
+        },
+        "include": {"boxart": {}},
+    }
+
+    async def test_identify_retries_empty_search_with_split_term(
+        self, thegamesdb_provider, http_mock
+    ):
+        """Test an empty search result is retried with the last part of the title."""
+        # An empty search still carries the "games" key
+        route = http_mock.get(THEGAMESDB_BY_NAME_URL_PATTERN).mock(
+            side_effect=[
+                httpx.Response(200, json={"data": {"count": 0, "games": []}}),
+                httpx.Response(200, json=self.game_response),
+            ]
+        )
 
-            assert len(results) > 0, "Expected results, got none"
-            assert results[0].name == "The Legend of Zelda: A Link to the Past"
-            assert results[0].provider == "mobygames"
-            assert results[0].provider_id == 564
-        finally:
-            await provider.close()
+        result = await thegamesdb_provider.identify(
+            "Castlevania - Symphony of the Night (USA).cue", platform_id=10
+        )
 
+        assert route.call_count == 2
+        first_name, retry_name = (call.request.url.params["name"] for call in route.calls)
+        assert first_name == "Castlevania - Symphony of the Night"
+        assert retry_name.strip() == "Symphony of the Night"
 
-class TestProviderErrorHandling:
-    """Test error handling across providers."""
+        assert result is not None, "Expected result, got None"
+        assert result.provider_id == 1234
 
-    @pytest.fixture
-    def igdb_config(self):
-        """Create a test IGDB configuration."""
-        return ProviderConfig(
-            enabled=True,
-            credentials={
-                "client_id": "test_client_id",
-                "client_secret": "test_client_secret",
-            },
-            timeout=30,
+    async def test_identify_does_not_retry_non_empty_search(self, thegamesdb_provider, http_mock):
+        """Test a search with results is not retried."""
+        route = http_mock.get(THEGAMESDB_BY_NAME_URL_PATTERN).mock(
+            return_value=httpx.Response(200, json=self.game_response)
         )
 
-    @pytest.fixture
-    def mobygames_config(self):
-        """Create a test MobyGames configuration."""
-        return ProviderConfig(
-            enabled=True,
-            credentials={
-                "api_key": "test_api_key",
-            },
-            timeout=30,
+        result = await thegamesdb_provider.identify(
+            "Castlevania - Symphony of the Night (USA).cue", platform_id=10
         )
 
-    async def test_igdb_500_error(self, igdb_config):
-        """Test IGDB provider handles server errors."""
-        oauth_response = {
-            "access_token": "test_token",
-            "expires_in": 3600,
-            "token_type": "bearer",
-        }
-
-        with aioresponses() as mocked:
-            # Mock OAuth token endpoint
-            mocked.post(
-                re.compile(r"https://id\.twitch\.tv/oauth2/token.*"),
-                payload=oauth_response,
-            )
-
-            # Mock IGDB endpoint with 500 error
-            mocked.post(
-                re.compile(r"https://api\.igdb\.com/v4/games.*"),
-                status=500,
-            )
-
-            provider = IGDBProvider(igdb_config)
-
-            try:
-                with pytest.raises(Exception):  # noqa: B017
-                    await provider.search("Test", limit=10)
-            finally:
-                await provider.close()
-
-    @respx.mock
-    async def test_mobygames_500_error(self, mobygames_config):
-        """Test MobyGames provider handles server errors."""
-        # Mock MobyGames endpoint with 500 error using respx for httpx
-        respx.get(re.compile(r"https://api\.mobygames\.com/v1/games.*")).mock(
-            return_value=httpx.Response(500)
-        )
+        assert route.call_count == 1
+        assert result is not None, "Expected result, got None"
+        assert result.provider_id == 1234
 
-        provider = MobyGamesProvider(mobygames_config)
 
-        try:
-            with pytest.raises(Exception):  # noqa: B017
-                await provider.search("Test", limit=10)
-        finally:
-            await provider.close()
+class TestProviderErrorHandling:
+    """Test error handling across providers."""
+
+    @pytest.fixture
+    def provider(self, request):
+        """Set up only the provider named by the test parameter."""
+        # Resolved during setup, since async fixtures cannot be set up from a running loop
+        return request.getfixturevalue(f"{request.param}_provider")
+
+    @pytest.mark.parametrize(
+        "provider, method, url_pattern, expected_error",
+        [
+            ("igdb", "POST", IGDB_GAMES_URL_PATTERN, ProviderConnectionError),
+            ("mobygames", "GET", MOBYGAMES_GAMES_URL_PATTERN, httpx.HTTPStatusError),
+        ],
+        indirect=["provider"],
+    )
+    async def test_provider_500_error(
+        self, provider, method, url_pattern, expected_error, http_mock
+    ):
+        """Test each provider handles server errors."""
+        # Mock the provider's games endpoint with 500 error
+        http_mock.route(method=method, url=url_pattern).mock(return_value=httpx.Response(500))
+
+        with pytest.raises(expected_error):
+            await provider.search("Test", limit=10)
 
 
 class TestDisabledProvider: